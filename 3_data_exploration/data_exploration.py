@@ -10,6 +10,7 @@ This script performs comprehensive analysis of supply chain delays including:
 """
 
 import os
+import sys
 import warnings
 
 # pylint: disable=import-error
@@ -18,6 +19,7 @@ import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 import plotly.express as px  # type: ignore
 import seaborn as sns  # type: ignore
+from data_ingestion import compute_delay_days, load_extracts
 
 # pylint: enable=import-error
 
@@ -39,38 +41,19 @@ except OSError:
 sns.set_palette("husl")
 
 # Load the data - adjust path relative to script location
+# Extra command-line arguments may name glob patterns or a manifest file,
+# e.g. python data_exploration.py "extracts/orders_*.csv"
 script_dir = os.path.dirname(os.path.abspath(__file__))
 data_path = os.path.join(
     script_dir, "..", "2_data_preparation", "orders_and_shipments_final_cleaned.csv"
 )
+data_sources = sys.argv[1:] or [data_path]
 
-# Check if file exists
-if not os.path.exists(data_path):
-    raise FileNotFoundError(f"Data file not found at: {data_path}")
-
-df = pd.read_csv(data_path)
-print(f"Data loaded successfully from: {data_path}")
-
-# Validate required columns exist
-required_columns = [
-    "Order Date",
-    "Shipment Date",
-    "Shipment Days - Scheduled",
-    "Region",
-    "Shipment Mode",
-    "Product Department",
-    "Product Category",
-    "Customer Market",
-    "Warehouse Country",
-    "Customer Country",
-    "Order Quantity",
-]
-missing_columns = [col for col in required_columns if col not in df.columns]
-if missing_columns:
-    raise KeyError(
-        f"Missing required columns in dataset: {missing_columns}\n"
-        f"Available columns: {list(df.columns)}"
-    )
+# Read all extracts concurrently; schema is validated per file
+df, failed_sources = load_extracts(data_sources)
+print(f"Data loaded successfully: {len(df):,} rows from {data_sources}")
+if failed_sources:
+    print(f"Warning: {len(failed_sources)} data file(s) could not be loaded")
 
 # Basic data exploration
 print("=== DATA OVERVIEW ===")
@@ -109,18 +92,8 @@ except (ValueError, KeyError, AttributeError, TypeError, OSError) as e:  # pylin
     df["Order Date"] = pd.to_datetime(df["Order Date"], errors="coerce")
     df["Shipment Date"] = pd.to_datetime(df["Shipment Date"], errors="coerce")
 
-# Calculate actual shipment days (handle NaT values)
-df["Shipment Days - Actual"] = (df["Shipment Date"] - df["Order Date"]).dt.days
-
-# Validate that scheduled days is numeric
-if not pd.api.types.is_numeric_dtype(df["Shipment Days - Scheduled"]):
-    print("Warning: Converting 'Shipment Days - Scheduled' to numeric...")
-    df["Shipment Days - Scheduled"] = pd.to_numeric(
-        df["Shipment Days - Scheduled"], errors="coerce"
-    )
-
-# Calculate delay (positive = delayed, negative = early)
-df["Delay Days"] = df["Shipment Days - Actual"] - df["Shipment Days - Scheduled"]
+# Calculate actual shipment days and delay (positive = delayed, negative = early)
+df = compute_delay_days(df)
 
 # Handle any NaN values that might have been introduced
 missing_data_count = (
@@ -676,9 +649,12 @@ def export_key_metrics(dataframe):  # pylint: disable=redefined-outer-name
 
     summary_df.to_csv(summary_path, index=False)
 
-    # Export processed data with delays
+    # Export processed data with delays; the source column holds paths on
+    # this machine, so it is left out of the shared export
     try:
-        df.to_csv(processed_path, index=False)
+        df.drop(columns=["Source File"], errors="ignore").to_csv(
+            processed_path, index=False
+        )
         print("\n Data exported successfully:")
         print(f"   • {summary_path}")
         print(f"   • {processed_path}")
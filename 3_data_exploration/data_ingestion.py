@@ -0,0 +1,219 @@
+"""
+Supply Chain Data Ingestion
+
+This module loads one or more cleaned order/shipment extracts including:
+- Source resolution from glob patterns or a manifest file
+- Concurrent reading and parsing (threaded I/O)
+- Per-file normalization and schema validation
+- Per-file progress reporting and error isolation
+- A single combine step into one dataframe
+- Shared derivation of actual shipment days and delay days
+"""
+
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# pylint: disable=import-error
+import pandas as pd  # type: ignore
+
+# pylint: enable=import-error
+
+try:
+    import pyarrow  # type: ignore  # noqa: F401  # pylint: disable=unused-import
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+DATE_FORMAT = "%m/%d/%Y"
+
+REQUIRED_COLUMNS = [
+    "Order Date",
+    "Shipment Date",
+    "Shipment Days - Scheduled",
+    "Region",
+    "Shipment Mode",
+    "Product Department",
+    "Product Category",
+    "Customer Market",
+    "Warehouse Country",
+    "Customer Country",
+    "Order Quantity",
+]
+
+# Encoding artefacts fixed in 2_data_preparation/cleaning_data_script.ipynb
+COUNTRY_REPLACEMENTS = {
+    "ï¿½": "'",
+    "Per�": "Peru",
+    "Ben�n": "Benin",
+    "Dominican�Republic": "Dominican Republic",
+    "Cote d�Ivoire": "Cote d'Ivoire",
+}
+
+
+def resolve_sources(sources, _visited_manifests=None):
+    """
+    Expand glob patterns and manifest files into a list of CSV paths.
+
+    A manifest is a ``.txt`` file listing one path or glob per line; blank
+    lines and lines starting with ``#`` are skipped, and relative entries
+    are resolved against the manifest's directory. Globs may match manifests
+    as well as CSVs (e.g. ``extracts/*.txt``). Manifests may list other
+    manifests; each one is read at most once, so cycles are ignored.
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    if _visited_manifests is None:
+        _visited_manifests = set()
+
+    paths = []
+    for source in sources:
+        # Keep unmatched literal paths so the missing file is reported
+        matches = sorted(glob.glob(source)) or [source]
+        for match in matches:
+            if not (match.endswith(".txt") and os.path.isfile(match)):
+                paths.append(match)
+                continue
+
+            manifest_path = os.path.realpath(match)
+            if manifest_path in _visited_manifests:
+                continue
+            _visited_manifests.add(manifest_path)
+
+            manifest_dir = os.path.dirname(manifest_path)
+            with open(manifest_path, encoding="utf-8") as manifest:
+                entries = [
+                    line.strip()
+                    for line in manifest
+                    if line.strip() and not line.strip().startswith("#")
+                ]
+            entries = [
+                entry if os.path.isabs(entry) else os.path.join(manifest_dir, entry)
+                for entry in entries
+            ]
+            paths.extend(resolve_sources(entries, _visited_manifests))
+
+    # Preserve order while dropping duplicates
+    return list(dict.fromkeys(os.path.abspath(path) for path in paths))
+
+
+def normalize_extract(extract_df, source_path):
+    """
+    Apply the cleaning normalization and schema checks to a single extract
+    """
+    extract_df.columns = extract_df.columns.str.strip()
+
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in extract_df.columns]
+    if missing_columns:
+        raise KeyError(f"Missing required columns in {source_path}: {missing_columns}")
+
+    if pd.api.types.is_string_dtype(extract_df["Customer Country"]):
+        countries = extract_df["Customer Country"]
+        for bad_text, fixed_text in COUNTRY_REPLACEMENTS.items():
+            countries = countries.str.replace(bad_text, fixed_text, regex=False)
+        extract_df["Customer Country"] = countries.str.strip()
+
+    extract_df["Shipment Days - Scheduled"] = pd.to_numeric(
+        extract_df["Shipment Days - Scheduled"], errors="coerce"
+    )
+    extract_df["Order Quantity"] = pd.to_numeric(
+        extract_df["Order Quantity"], errors="coerce"
+    )
+
+    # Keep the full path so extracts sharing a file name in different
+    # directories (e.g. extracts/2017-01/orders.csv) stay distinguishable
+    extract_df["Source File"] = os.path.abspath(source_path)
+    return extract_df
+
+
+def read_extract(source_path):
+    """
+    Read and normalize one extract; raises on any read or schema error
+    """
+    if not os.path.exists(source_path):
+        raise FileNotFoundError(f"Data file not found at: {source_path}")
+
+    # Dates stay as strings here; compute_delay_days parses them with
+    # an explicit format after the combine step.
+    extract_df = pd.read_csv(
+        source_path,
+        engine=CSV_ENGINE,
+        dtype={"Order Date": str, "Shipment Date": str},
+    )
+    return normalize_extract(extract_df, source_path)
+
+
+def load_extracts(sources, max_workers=None):
+    """
+    Load every extract matched by ``sources`` concurrently and combine them.
+
+    Each file is read on its own worker thread. A file that fails to read or
+    validate is reported and skipped without affecting the others. Returns
+    the combined dataframe and a dict mapping failed paths to their error.
+    """
+    source_paths = resolve_sources(sources)
+    if not source_paths:
+        raise FileNotFoundError(f"No data files matched: {sources}")
+
+    total = len(source_paths)
+    if max_workers is None:
+        max_workers = min(total, (os.cpu_count() or 1) * 2)
+
+    frames = {}
+    failures = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(read_extract, path): path for path in source_paths}
+        for done, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            try:
+                frames[path] = future.result()
+                print(f"[{done}/{total}] Loaded {len(frames[path]):,} rows: {path}")
+            except (ValueError, KeyError, OSError) as e:
+                failures[path] = e
+                print(f"[{done}/{total}] Warning: Skipping {path}: {e}")
+
+    if not frames:
+        raise ValueError(f"All {total} data files failed to load: {failures}")
+
+    # One concat over all frames, in source order, to avoid repeated copies
+    combined_df = pd.concat(
+        [frames[path] for path in source_paths if path in frames],
+        ignore_index=True,
+    )
+    combined_df["Source File"] = combined_df["Source File"].astype("category")
+    return combined_df, failures
+
+
+def parse_dates(column):
+    """
+    Parse a date column in the cleaned ``DATE_FORMAT``, falling back to
+    format inference for values that do not match (e.g. ISO dates written
+    by data_exploration.py's processed export)
+    """
+    parsed = pd.to_datetime(column, format=DATE_FORMAT, errors="coerce")
+    unparsed = parsed.isna() & column.notna()
+    if unparsed.any():
+        parsed[unparsed] = pd.to_datetime(column[unparsed], errors="coerce")
+    return parsed
+
+
+def compute_delay_days(dataframe):
+    """
+    Parse the date columns and (re)compute 'Shipment Days - Actual' and
+    'Delay Days' (actual minus scheduled shipment days; positive = delayed).
+    Existing values are always overwritten so every row uses the same rule.
+    Unparseable dates and scheduled days become NaT/NaN rather than raising.
+    """
+    for column in ("Order Date", "Shipment Date"):
+        dataframe[column] = parse_dates(dataframe[column])
+    dataframe["Shipment Days - Scheduled"] = pd.to_numeric(
+        dataframe["Shipment Days - Scheduled"], errors="coerce"
+    )
+    dataframe["Shipment Days - Actual"] = (
+        dataframe["Shipment Date"] - dataframe["Order Date"]
+    ).dt.days
+    dataframe["Delay Days"] = (
+        dataframe["Shipment Days - Actual"] - dataframe["Shipment Days - Scheduled"]
+    )
+    return dataframe
@@ -0,0 +1,252 @@
+"""
+Supply Chain Delay Anomaly Detection
+
+This script watches incoming shipment batches for sudden delay spikes including:
+- Per-group exponentially weighted mean/variance of delay days
+- Incremental batch updates (cost grows with new rows only)
+- Alerts when a group's batch delay drifts beyond its threshold
+- State persisted to JSON between runs, including how much of each extract
+  was consumed, so re-runs fold in only rows appended since
+
+Usage:
+    python delay_anomaly_detection.py STATE_FILE SOURCE [SOURCE ...]
+
+SOURCE may be a CSV path, glob pattern or manifest, as in data_ingestion.py.
+Extracts are treated as append-only.
+"""
+
+import io
+import json
+import os
+import sys
+
+# pylint: disable=import-error
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+from data_ingestion import (
+    CSV_ENGINE,
+    compute_delay_days,
+    normalize_extract,
+    resolve_sources,
+)
+
+# pylint: enable=import-error
+
+DIMENSIONS = ["Region", "Shipment Mode", "Warehouse Country"]
+
+# Weight of a single new shipment in the running statistics
+ALPHA = 0.001
+# Most a single batch can move the running statistics, however many rows it
+# has, so one extract never replaces the history (about 3 batches half-life)
+MAX_BATCH_WEIGHT = 0.2
+# Weight used instead for a group's batch that raised an alert, so a spike
+# does not become the new baseline; persistent shifts are absorbed slowly
+ALERT_BATCH_WEIGHT = 0.02
+# Batch mean must sit this many standard errors away to raise an alert
+Z_THRESHOLD = 3.0
+# ...and differ from the running mean by at least this many days, since
+# large batches make even negligible shifts statistically significant
+MIN_EFFECT_DAYS = 1.0
+# Shipments a group must have seen before it can raise alerts
+MIN_HISTORY = 100
+
+
+def load_detector_state(state_path):
+    """
+    Load persisted per-group statistics, or start empty if none exist yet
+    """
+    state = {}
+    if os.path.exists(state_path):
+        with open(state_path, encoding="utf-8") as state_file:
+            state = json.load(state_file)
+
+    for dimension in DIMENSIONS:
+        state.setdefault(dimension, {})
+    # Maps each consumed extract path to the bytes and rows read so far
+    state.setdefault("Processed Files", {})
+    return state
+
+
+def save_detector_state(state, state_path):
+    """
+    Persist per-group statistics atomically so a crash cannot corrupt them
+    """
+    temp_path = f"{state_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as state_file:
+        json.dump(state, state_file, indent=2, sort_keys=True)
+    os.replace(temp_path, state_path)
+
+
+def read_new_rows(source_path, start_offset, end_offset):
+    """
+    Read and normalize the rows stored between two byte offsets of an
+    extract, re-using its header line, so only appended rows are parsed
+    """
+    with open(source_path, "rb") as extract_file:
+        header = extract_file.readline()
+        start_offset = max(start_offset, len(header))
+        if start_offset > len(header):
+            # A previous read must have stopped at the end of a line
+            extract_file.seek(start_offset - 1)
+            if extract_file.read(1) != b"\n":
+                raise ValueError(f"{source_path} changed since it was processed")
+        extract_file.seek(start_offset)
+        body = extract_file.read(max(end_offset - start_offset, 0))
+
+    extract_df = pd.read_csv(
+        io.BytesIO(header + body),
+        engine=CSV_ENGINE,
+        dtype={"Order Date": str, "Shipment Date": str},
+    )
+    return normalize_extract(extract_df, source_path)
+
+
+def update_detector(
+    state,
+    batch_df,
+    alpha=ALPHA,
+    z_threshold=Z_THRESHOLD,
+    min_effect_days=MIN_EFFECT_DAYS,
+):
+    """
+    Score one batch against the running statistics, then fold it in.
+
+    A group alerts when its batch mean is both more than ``z_threshold``
+    standard errors (``sqrt(variance / batch_count)``) and at least
+    ``min_effect_days`` away from its exponentially weighted mean. The batch
+    is then folded in as ``n`` single-shipment updates, capped at
+    ``MAX_BATCH_WEIGHT`` (``ALERT_BATCH_WEIGHT`` for an alerting group), so
+    one groupby per dimension is all the work needed. Returns a list of
+    alert dicts.
+    """
+    batch_df = compute_delay_days(batch_df)
+    valid_df = batch_df[batch_df["Delay Days"].notna()]
+
+    alerts = []
+    for dimension in DIMENSIONS:
+        if dimension not in valid_df.columns:
+            continue
+
+        batch_stats = valid_df.groupby(dimension, observed=True)["Delay Days"].agg(
+            ["mean", "var", "count"]
+        )
+        group_states = state.setdefault(dimension, {})
+
+        for group, row in batch_stats.iterrows():
+            batch_mean = float(row["mean"])
+            batch_var = 0.0 if pd.isna(row["var"]) else float(row["var"])
+            batch_count = int(row["count"])
+
+            group_state = group_states.get(str(group))
+            if group_state is None:
+                group_states[str(group)] = {
+                    "mean": batch_mean,
+                    "var": batch_var,
+                    "count": batch_count,
+                }
+                continue
+
+            prior_mean = group_state["mean"]
+            prior_var = group_state["var"]
+            # Equivalent weight of batch_count single-shipment updates
+            weight = min(1 - (1 - alpha) ** batch_count, MAX_BATCH_WEIGHT)
+            if group_state["count"] >= MIN_HISTORY and prior_var > 0:
+                z_score = (batch_mean - prior_mean) / np.sqrt(prior_var / batch_count)
+                effect_days = abs(batch_mean - prior_mean)
+                if abs(z_score) > z_threshold and effect_days >= min_effect_days:
+                    weight = min(weight, ALERT_BATCH_WEIGHT)
+                    alerts.append(
+                        {
+                            "Dimension": dimension,
+                            "Group": str(group),
+                            "Direction": "spike" if z_score > 0 else "drop",
+                            "Batch Avg Delay": round(batch_mean, 2),
+                            "Expected Avg Delay": round(prior_mean, 2),
+                            "Z Score": round(float(z_score), 2),
+                            "Batch Shipments": batch_count,
+                        }
+                    )
+
+            shift = batch_mean - prior_mean
+            group_state["mean"] = prior_mean + weight * shift
+            group_state["var"] = (1 - weight) * (
+                prior_var + weight * shift**2
+            ) + weight * batch_var
+            group_state["count"] += batch_count
+
+    return alerts
+
+
+def print_delay_alerts(alerts):
+    """
+    Print alerts in the same layout as the key insights summary
+    """
+    print("\n" + "=" * 50)
+    print("DELAY ANOMALY ALERTS")
+    print("=" * 50)
+
+    if not alerts:
+        print(" No groups drifted beyond their thresholds.")
+        return
+
+    for alert in sorted(alerts, key=lambda a: -abs(a["Z Score"])):
+        print(
+            f"   • {alert['Dimension']} = {alert['Group']}: "
+            f"{alert['Batch Avg Delay']:.1f} days vs "
+            f"{alert['Expected Avg Delay']:.1f} expected "
+            f"({alert['Direction']}, z={alert['Z Score']:.1f}, "
+            f"{alert['Batch Shipments']:,} shipments)"
+        )
+
+
+def main(argv):
+    """
+    Update persisted state with new batch files and report any alerts
+    """
+    if len(argv) < 2:
+        print(__doc__)
+        return 1
+
+    state_path, sources = argv[0], argv[1:]
+    state = load_detector_state(state_path)
+    processed_files = state["Processed Files"]
+
+    # Read only the bytes appended to each extract since the last run
+    batches = []
+    failures = {}
+    for path in resolve_sources(sources):
+        record = processed_files.get(path, {"bytes": 0, "rows": 0})
+        try:
+            size = os.path.getsize(path)
+            if size == record["bytes"]:
+                continue
+            if size < record["bytes"]:
+                raise ValueError(f"{path} shrank since it was processed")
+            batches.append((path, size, read_new_rows(path, record["bytes"], size)))
+        except (ValueError, KeyError, OSError) as e:
+            failures[path] = e
+            print(f"Warning: Skipping {path}: {e}")
+
+    if not batches:
+        if failures:
+            print(f"Warning: {len(failures)} extract(s) skipped; state left unchanged")
+        else:
+            print("No new rows to process.")
+        return 0
+
+    # Each extract's new rows are scored as their own batch, in source order
+    alerts = []
+    for path, size, batch_df in batches:
+        alerts.extend(update_detector(state, batch_df))
+        previous_rows = processed_files.get(path, {}).get("rows", 0)
+        processed_files[path] = {"bytes": size, "rows": previous_rows + len(batch_df)}
+    print_delay_alerts(alerts)
+    if failures:
+        print(f"\nWarning: {len(failures)} extract(s) skipped; they will be retried")
+    save_detector_state(state, state_path)
+    print(f"\nDetector state saved: {state_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,202 @@
+"""
+Tests for data_ingestion.py
+
+Run from this folder with: python -m unittest
+"""
+
+import os
+import tempfile
+import unittest
+
+# pylint: disable=import-error
+import pandas as pd  # type: ignore
+from data_ingestion import (
+    REQUIRED_COLUMNS,
+    compute_delay_days,
+    load_extracts,
+    normalize_extract,
+    resolve_sources,
+)
+
+# pylint: enable=import-error
+
+
+def write_extract(path, rows=3):
+    """
+    Write a minimal cleaned extract with the required columns
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    row = {column: "x" for column in REQUIRED_COLUMNS}
+    row.update(
+        {
+            "Order Date": "1/2/2016",
+            "Shipment Date": "1/6/2016",
+            "Shipment Days - Scheduled": 3,
+            "Order Quantity": 1,
+        }
+    )
+    pd.DataFrame([row] * rows).to_csv(path, index=False)
+
+
+class TestResolveSources(unittest.TestCase):
+    """Source resolution from globs and manifests"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_manifest(self, name, entries):
+        """Write a manifest file listing ``entries``"""
+        path = os.path.join(self.root, name)
+        with open(path, "w", encoding="utf-8") as manifest:
+            manifest.write("\n".join(entries) + "\n")
+        return path
+
+    def test_self_referencing_manifest_is_read_once(self):
+        write_extract(os.path.join(self.root, "orders.csv"))
+        manifest = self.write_manifest("manifest.txt", ["manifest.txt", "orders.csv"])
+
+        paths = resolve_sources(manifest)
+
+        self.assertEqual(paths, [os.path.join(self.root, "orders.csv")])
+
+    def test_mutually_referencing_manifests_are_read_once(self):
+        write_extract(os.path.join(self.root, "a.csv"))
+        write_extract(os.path.join(self.root, "b.csv"))
+        first = self.write_manifest("first.txt", ["second.txt", "a.csv"])
+        self.write_manifest("second.txt", ["first.txt", "b.csv"])
+
+        paths = resolve_sources(first)
+
+        self.assertEqual(
+            paths,
+            [os.path.join(self.root, "b.csv"), os.path.join(self.root, "a.csv")],
+        )
+
+    def test_glob_can_match_manifests(self):
+        for month in ("2017-01", "2017-02"):
+            write_extract(os.path.join(self.root, month, "orders.csv"))
+            self.write_manifest(f"{month}.txt", [f"{month}/orders.csv"])
+
+        paths = resolve_sources(os.path.join(self.root, "*.txt"))
+
+        self.assertEqual(
+            paths,
+            [
+                os.path.join(self.root, "2017-01", "orders.csv"),
+                os.path.join(self.root, "2017-02", "orders.csv"),
+            ],
+        )
+
+
+class TestNormalizeExtract(unittest.TestCase):
+    """Per-file cleaning normalization and schema checks"""
+
+    def test_country_text_and_numeric_columns_are_normalized(self):
+        extract_df = pd.DataFrame({column: ["x"] * 4 for column in REQUIRED_COLUMNS})
+        extract_df = extract_df.rename(columns={"Region": " Region "})
+        extract_df["Customer Country"] = [
+            "Per\ufffd",
+            " Dominican\ufffdRepublic ",
+            "Cote d\ufffdIvoire",
+            "Ben\ufffdn",
+        ]
+        extract_df["Shipment Days - Scheduled"] = ["3", "4", "n/a", "2"]
+        extract_df["Order Quantity"] = ["1", "2", "3", ""]
+
+        result = normalize_extract(extract_df, "/data/2017-01/orders.csv")
+
+        self.assertIn("Region", result.columns)
+        self.assertEqual(
+            result["Customer Country"].tolist(),
+            ["Peru", "Dominican Republic", "Cote d'Ivoire", "Benin"],
+        )
+        self.assertTrue(
+            pd.api.types.is_numeric_dtype(result["Shipment Days - Scheduled"])
+        )
+        self.assertEqual(result["Shipment Days - Scheduled"].iloc[0], 3)
+        self.assertTrue(pd.isna(result["Shipment Days - Scheduled"].iloc[2]))
+        self.assertTrue(pd.api.types.is_numeric_dtype(result["Order Quantity"]))
+        self.assertTrue(pd.isna(result["Order Quantity"].iloc[3]))
+        self.assertEqual(
+            result["Source File"].iloc[0], os.path.abspath("/data/2017-01/orders.csv")
+        )
+
+    def test_missing_required_column_raises(self):
+        extract_df = pd.DataFrame({column: ["x"] for column in REQUIRED_COLUMNS})
+
+        with self.assertRaises(KeyError):
+            normalize_extract(extract_df.drop(columns="Region"), "orders.csv")
+
+
+class TestLoadExtracts(unittest.TestCase):
+    """Concurrent loading and combining of extracts"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_same_file_name_in_different_directories_stays_separate(self):
+        for month in ("2017-01", "2017-02"):
+            write_extract(os.path.join(self.root, month, "orders.csv"))
+
+        combined_df, failures = load_extracts(
+            os.path.join(self.root, "*", "orders.csv")
+        )
+
+        self.assertEqual(failures, {})
+        self.assertEqual(len(combined_df), 6)
+        self.assertEqual(combined_df["Source File"].nunique(), 2)
+
+    def test_manifest_listing_missing_file_reports_it(self):
+        write_extract(os.path.join(self.root, "orders.csv"))
+        manifest = os.path.join(self.root, "manifest.txt")
+        with open(manifest, "w", encoding="utf-8") as manifest_file:
+            manifest_file.write("orders.csv\nmissing.csv\n")
+
+        combined_df, failures = load_extracts(manifest)
+
+        self.assertEqual(len(combined_df), 3)
+        self.assertEqual(list(failures), [os.path.join(self.root, "missing.csv")])
+        self.assertIsInstance(next(iter(failures.values())), FileNotFoundError)
+
+    def test_invalid_extract_is_skipped(self):
+        write_extract(os.path.join(self.root, "good.csv"))
+        pd.DataFrame({"x": [1]}).to_csv(os.path.join(self.root, "bad.csv"))
+
+        combined_df, failures = load_extracts(os.path.join(self.root, "*.csv"))
+
+        self.assertEqual(len(combined_df), 3)
+        self.assertEqual(list(failures), [os.path.join(self.root, "bad.csv")])
+
+
+class TestComputeDelayDays(unittest.TestCase):
+    """Shared derivation of actual shipment days and delay days"""
+
+    def test_stale_delay_column_is_recomputed_for_every_row(self):
+        # As if one extract was a processed export with its own Delay Days
+        # and ISO dates, combined with a raw cleaned extract
+        dataframe = pd.DataFrame(
+            {
+                "Order Date": ["2016-01-02", "01/02/2016", "not a date"],
+                "Shipment Date": ["2016-01-09", "01/04/2016", "01/04/2016"],
+                "Shipment Days - Scheduled": [3, "4", 4],
+                "Delay Days": [99.0, None, None],
+            }
+        )
+
+        result = compute_delay_days(dataframe)
+
+        self.assertEqual(result["Shipment Days - Actual"].tolist()[:2], [7, 2])
+        self.assertEqual(result["Delay Days"].tolist()[:2], [4, -2])
+        self.assertTrue(pd.isna(result["Delay Days"].iloc[2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Tests for delay_anomaly_detection.py
+
+Run from this folder with: python -m unittest
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+# pylint: disable=import-error
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+from data_ingestion import REQUIRED_COLUMNS
+from delay_anomaly_detection import load_detector_state, main, update_detector
+
+# pylint: enable=import-error
+
+
+def make_batch(rng, n_rows, oceania_shift=0, late_share=0.0):
+    """
+    Build a batch of shipments with real date and scheduled-days columns.
+    Oceania delays are shifted by ``oceania_shift`` days, and a random
+    ``late_share`` of all shipments arrive one day later than usual.
+    """
+    region = rng.choice(["Europe", "Asia", "Oceania"], n_rows)
+    delays = (
+        np.round(rng.normal(1.0, 2.0, n_rows))
+        + np.where(region == "Oceania", oceania_shift, 0)
+        + (rng.random(n_rows) < late_share)
+    )
+    scheduled_days = rng.integers(1, 5, n_rows)
+    order_dates = pd.Timestamp("2017-01-01") + pd.to_timedelta(
+        rng.integers(0, 28, n_rows), unit="D"
+    )
+    shipment_dates = order_dates + pd.to_timedelta(scheduled_days + delays, unit="D")
+    return pd.DataFrame(
+        {
+            "Order Date": order_dates.strftime("%m/%d/%Y"),
+            "Shipment Date": shipment_dates.strftime("%m/%d/%Y"),
+            "Shipment Days - Scheduled": scheduled_days,
+            "Region": region,
+            "Shipment Mode": rng.choice(["Standard Class", "First Class"], n_rows),
+            "Warehouse Country": rng.choice(["USA", "Puerto Rico"], n_rows),
+        }
+    )
+
+
+def _alert_keys(alerts):
+    return {(a["Dimension"], a["Group"], a["Direction"]) for a in alerts}
+
+
+class TestUpdateDetector(unittest.TestCase):
+    """Alerting on batch delay drift"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.state = {}
+        update_detector(self.state, make_batch(self.rng, 20_000))
+
+    def test_small_drift_in_large_batch_stays_quiet(self):
+        # One day later for 5% of shipments: a 0.05-day shift in the mean
+        alerts = update_detector(
+            self.state, make_batch(self.rng, 20_000, late_share=0.05)
+        )
+
+        self.assertEqual(alerts, [])
+
+    def test_real_spike_alerts_only_affected_group(self):
+        alerts = update_detector(
+            self.state, make_batch(self.rng, 20_000, oceania_shift=3.0)
+        )
+
+        self.assertIn(("Region", "Oceania", "spike"), _alert_keys(alerts))
+        self.assertNotIn(("Region", "Europe", "spike"), _alert_keys(alerts))
+
+    def test_return_to_normal_after_spike_stays_quiet(self):
+        update_detector(self.state, make_batch(self.rng, 20_000))
+        spike_alerts = update_detector(
+            self.state, make_batch(self.rng, 20_000, oceania_shift=3)
+        )
+
+        alerts = update_detector(self.state, make_batch(self.rng, 20_000))
+
+        self.assertIn(("Region", "Oceania", "spike"), _alert_keys(spike_alerts))
+        self.assertEqual(alerts, [])
+
+    def test_large_batch_does_not_replace_history(self):
+        prior_mean = self.state["Region"]["Europe"]["mean"]
+        batch_df = make_batch(self.rng, 20_000)
+        batch_df["Shipment Days - Scheduled"] -= 0.5  # 0.5 days later, no alert
+
+        alerts = update_detector(self.state, batch_df)
+
+        self.assertEqual(alerts, [])
+        self.assertLess(self.state["Region"]["Europe"]["mean"] - prior_mean, 0.2)
+
+
+class TestMain(unittest.TestCase):
+    """State persistence across runs"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        self.state_path = os.path.join(self.root, "state.json")
+
+        row = {column: "x" for column in REQUIRED_COLUMNS}
+        self.row = row
+        row.update(
+            {
+                "Order Date": "01/02/2016",
+                "Shipment Date": "01/06/2016",
+                "Shipment Days - Scheduled": 3,
+                "Region": "Europe",
+                "Order Quantity": 1,
+            }
+        )
+        for month in ("2017-01", "2017-02"):
+            os.makedirs(os.path.join(self.root, month))
+            pd.DataFrame([row] * 10).to_csv(
+                os.path.join(self.root, month, "orders.csv"), index=False
+            )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_main(self, pattern="*/orders.csv"):
+        """Run the script entry point on the extracts matching ``pattern``"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            exit_code = main([self.state_path, os.path.join(self.root, pattern)])
+        self.assertEqual(exit_code, 0)
+        return load_detector_state(self.state_path)
+
+    def test_each_extract_is_recorded_and_not_refolded(self):
+        first_state = self.run_main()
+        second_state = self.run_main()
+
+        self.assertEqual(len(first_state["Processed Files"]), 2)
+        self.assertEqual(first_state["Region"]["Europe"]["count"], 20)
+        self.assertEqual(second_state["Region"]["Europe"]["count"], 20)
+
+    def test_only_appended_rows_are_folded_in(self):
+        self.run_main()
+        extract_path = os.path.join(self.root, "2017-01", "orders.csv")
+        pd.DataFrame([self.row] * 5).to_csv(
+            extract_path, mode="a", header=False, index=False
+        )
+
+        state = self.run_main()
+
+        self.assertEqual(state["Region"]["Europe"]["count"], 25)
+        self.assertEqual(state["Processed Files"][extract_path]["rows"], 15)
+
+    def test_rewritten_extract_is_not_refolded(self):
+        self.run_main()
+        extract_path = os.path.join(self.root, "2017-01", "orders.csv")
+        pd.DataFrame([self.row] * 3).to_csv(extract_path, index=False)
+
+        state = self.run_main()
+
+        self.assertEqual(state["Region"]["Europe"]["count"], 20)
+
+    def test_no_matching_extracts_exits_cleanly_without_state(self):
+        self.run_main("missing/*.csv")
+
+        self.assertFalse(os.path.exists(self.state_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
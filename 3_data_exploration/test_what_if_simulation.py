@@ -0,0 +1,116 @@
+"""
+Tests for what_if_simulation.py
+
+Run from this folder with: python -m unittest
+"""
+
+import unittest
+
+# pylint: disable=import-error
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+from what_if_simulation import (
+    CELL_COLUMNS,
+    build_delay_distributions,
+    build_scenario_matrix,
+    simulate_scenarios,
+    single_move_scenarios,
+)
+
+# pylint: enable=import-error
+
+
+def make_shipments(seed=1):
+    """
+    Synthetic shipments over 2 warehouses x 10 regions x 4 modes, with
+    uneven cell volumes and a different delay level per cell
+    """
+    rng = np.random.default_rng(seed)
+    frames = []
+    for warehouse in ("USA", "Puerto Rico"):
+        for region in (f"Region {i}" for i in range(10)):
+            for mode in ("Standard Class", "Second Class", "First Class", "Same Day"):
+                n_rows = int(rng.integers(40, 2_000))
+                frames.append(
+                    pd.DataFrame(
+                        {
+                            "Warehouse Country": warehouse,
+                            "Region": region,
+                            "Shipment Mode": mode,
+                            "Delay Days": np.round(
+                                rng.normal(rng.normal(0.5, 1.0), 2.0, n_rows)
+                            ),
+                        }
+                    )
+                )
+    return pd.concat(frames, ignore_index=True)
+
+
+class TestSimulateScenarios(unittest.TestCase):
+    """Monte Carlo results against exact expectations"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.shipments = make_shipments()
+        cls.distributions = build_delay_distributions(cls.shipments)
+        cls.scenarios = single_move_scenarios(cls.distributions)
+        cls.scenario_matrix = build_scenario_matrix(cls.distributions, cls.scenarios)
+        cls.results = simulate_scenarios(cls.distributions, cls.scenario_matrix)
+
+    def test_on_time_change_matches_exact_mixture(self):
+        on_time = (
+            self.shipments.assign(on_time=self.shipments["Delay Days"] <= 0)
+            .groupby(CELL_COLUMNS)["on_time"]
+            .mean()
+        )
+        cell_lookup = {cell: i for i, cell in enumerate(self.distributions["cells"])}
+        # A single move shifts the origin's volume share onto the target
+        exact_change = [0.0] + [
+            self.distributions["volumes"][cell_lookup[origin]]
+            * (on_time[target] - on_time[origin])
+            for moves in self.scenarios[1:]
+            for origin, target in moves.items()
+        ]
+        simulated_change = (
+            self.results["On_Time_Rate"] - self.results["On_Time_Rate"].iloc[0]
+        )
+        # Four standard errors of the difference of two on-time rates, each
+        # estimated from the default 2,000 draws, scaled by the moved volume
+        moved_volume = np.array(
+            [0.0]
+            + [
+                self.distributions["volumes"][cell_lookup[origin]]
+                for moves in self.scenarios[1:]
+                for origin in moves
+            ]
+        )
+        tolerance = 4 * moved_volume * np.sqrt(2 * 0.25 / 2_000)
+
+        self.assertTrue(np.all(np.abs(simulated_change - exact_change) <= tolerance))
+        self.assertGreater(np.corrcoef(simulated_change, exact_change)[0, 1], 0.99)
+
+    def test_baseline_matches_observed_data(self):
+        baseline = self.results.iloc[0]
+
+        self.assertAlmostEqual(
+            baseline["On_Time_Rate"], (self.shipments["Delay Days"] <= 0).mean(), 2
+        )
+        self.assertAlmostEqual(
+            baseline["Avg_Delay_Days"], self.shipments["Delay Days"].mean(), 1
+        )
+        self.assertEqual(
+            baseline["P50_Delay"], self.shipments["Delay Days"].quantile(0.5)
+        )
+
+    def test_same_seed_gives_same_results(self):
+        repeated = simulate_scenarios(self.distributions, self.scenario_matrix)
+
+        pd.testing.assert_frame_equal(repeated, self.results)
+
+    def test_empty_scenario_matrix_raises(self):
+        with self.assertRaises(ValueError):
+            simulate_scenarios(self.distributions, self.scenario_matrix[:0])
+
+
+if __name__ == "__main__":
+    unittest.main()
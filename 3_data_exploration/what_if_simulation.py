@@ -0,0 +1,241 @@
+"""
+Supply Chain What-If Simulation
+
+This script estimates how delays would change if lanes were moved to another
+Shipment Mode or Warehouse Country including:
+- Empirical delay distributions per (Warehouse Country, Region, Shipment Mode)
+- Reassignment scenarios expressed as origin -> target cell mappings
+- Fixed-size NumPy Monte Carlo resampling per cell, mixed across all
+  scenarios at once with matrix products
+- Expected on-time rate and delay percentiles per scenario
+- Seeded sampling for reproducible results
+
+Usage:
+    python what_if_simulation.py [SOURCE ...]
+
+SOURCE may be a CSV path, glob pattern or manifest, as in data_ingestion.py.
+"""
+
+import os
+import sys
+
+# pylint: disable=import-error
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+from data_ingestion import compute_delay_days, load_extracts
+
+# pylint: enable=import-error
+
+CELL_COLUMNS = ["Warehouse Country", "Region", "Shipment Mode"]
+PERCENTILES = (50, 90, 95)
+
+
+def build_delay_distributions(dataframe, min_shipments=30):
+    """
+    Pack the observed delays of every (warehouse, region, mode) cell into one
+    array grouped by cell, with offsets and counts to locate each cell's slice.
+    Cells with fewer than ``min_shipments`` observations are dropped.
+    """
+    valid_df = dataframe.dropna(subset=CELL_COLUMNS + ["Delay Days"])
+    grouped = valid_df.groupby(CELL_COLUMNS, observed=True)["Delay Days"]
+    counts = grouped.size()
+    counts = counts[counts >= min_shipments]
+    if counts.empty:
+        raise ValueError("No cells have enough shipments to simulate")
+
+    # Sort once by cell so each cell's delays are contiguous
+    cell_index = pd.MultiIndex.from_frame(valid_df[CELL_COLUMNS])
+    cell_codes = counts.index.get_indexer(cell_index)
+    keep = cell_codes >= 0
+    order = np.argsort(cell_codes[keep], kind="stable")
+    delays = valid_df["Delay Days"].to_numpy(dtype=float)[keep][order]
+
+    cell_counts = counts.to_numpy()
+    offsets = np.concatenate([[0], np.cumsum(cell_counts)[:-1]])
+    return {
+        "cells": list(counts.index),
+        "delays": delays,
+        "offsets": offsets,
+        "counts": cell_counts,
+        "volumes": cell_counts / cell_counts.sum(),
+    }
+
+
+def build_scenario_matrix(distributions, scenarios):
+    """
+    Convert scenarios into an (n_scenarios, n_cells) array of target cells.
+
+    Each scenario is a dict mapping an origin cell tuple to the target cell
+    tuple its shipments move to; cells not mentioned stay where they are.
+    """
+    cell_lookup = {cell: i for i, cell in enumerate(distributions["cells"])}
+    n_cells = len(cell_lookup)
+
+    scenario_matrix = np.tile(np.arange(n_cells), (len(scenarios), 1))
+    for row, moves in enumerate(scenarios):
+        for origin, target in moves.items():
+            if origin not in cell_lookup:
+                raise KeyError(f"Unknown origin cell in scenario {row}: {origin}")
+            if target not in cell_lookup:
+                raise KeyError(f"No delay history for target cell: {target}")
+            scenario_matrix[row, cell_lookup[origin]] = cell_lookup[target]
+    return scenario_matrix
+
+
+def single_move_scenarios(distributions):
+    """
+    Enumerate every move of one cell to another mode or another warehouse
+    that serves the same region. The first scenario is the unchanged baseline.
+    """
+    cells = distributions["cells"]
+    scenarios = [{}]
+    for warehouse, region, mode in cells:
+        for target in cells:
+            target_warehouse, target_region, target_mode = target
+            if target_region != region or target == (warehouse, region, mode):
+                continue
+            # Change either the mode or the warehouse, not both
+            if target_warehouse == warehouse or target_mode == mode:
+                scenarios.append({(warehouse, region, mode): target})
+    return scenarios
+
+
+def _scenario_weights(distributions, scenario_matrix):
+    """
+    Volume share each target cell receives in every scenario, as an
+    (n_scenarios, n_cells) array whose rows sum to one
+    """
+    n_scenarios, n_cells = scenario_matrix.shape
+    flat_targets = (np.arange(n_scenarios)[:, None] * n_cells + scenario_matrix).ravel()
+    weights = np.bincount(
+        flat_targets,
+        weights=np.tile(distributions["volumes"], n_scenarios),
+        minlength=n_scenarios * n_cells,
+    )
+    return weights.reshape(n_scenarios, n_cells)
+
+
+def simulate_scenarios(
+    distributions,
+    scenario_matrix,
+    samples_per_cell=2_000,
+    seed=42,
+):
+    """
+    Monte Carlo estimate of delay outcomes for every scenario.
+
+    Every cell's empirical delays are resampled ``samples_per_cell`` times,
+    so a moved cell is judged on the same number of draws however small its
+    volume. A scenario's outcome is the volume-weighted mixture of its
+    target cells' samples: on-time rate and mean are weighted averages, and
+    percentiles are read off the mixture CDF. All scenarios share the same
+    draws, so differences between them come from the reassignment rather
+    than noise, and results are identical for a given seed. Returns one row
+    of metrics per scenario.
+    """
+    scenario_matrix = np.asarray(scenario_matrix)
+    if scenario_matrix.size == 0:
+        raise ValueError("No scenarios to simulate")
+
+    rng = np.random.default_rng(seed)
+    n_cells = len(distributions["cells"])
+    uniform_draws = rng.random((n_cells, samples_per_cell))
+    positions = distributions["offsets"][:, None] + (
+        uniform_draws * distributions["counts"][:, None]
+    ).astype(np.int64)
+    sampled = distributions["delays"][positions]
+
+    # Per-cell summaries of the resampled delays
+    grid, grid_codes = np.unique(sampled, return_inverse=True)
+    grid_codes = grid_codes.reshape(sampled.shape)
+    cell_histograms = np.bincount(
+        (np.arange(n_cells)[:, None] * len(grid) + grid_codes).ravel(),
+        minlength=n_cells * len(grid),
+    ).reshape(n_cells, len(grid))
+    cell_cdfs = np.cumsum(cell_histograms, axis=1) / samples_per_cell
+    cell_on_time = (sampled <= 0).mean(axis=1)
+    cell_means = sampled.mean(axis=1)
+
+    # Mix the cell summaries for every scenario with one matrix product each
+    weights = _scenario_weights(distributions, scenario_matrix)
+    scenario_cdfs = weights @ cell_cdfs
+    # Smallest delay whose mixture CDF reaches the percentile; the tolerance
+    # absorbs rounding in the weighted sums
+    percentile_values = []
+    for percentile in PERCENTILES:
+        below = (scenario_cdfs < percentile / 100 - 1e-9).sum(axis=1)
+        percentile_values.append(grid[np.minimum(below, len(grid) - 1)])
+
+    results = np.column_stack(
+        [weights @ cell_on_time, weights @ cell_means] + percentile_values
+    )
+    columns = ["On_Time_Rate", "Avg_Delay_Days"] + [
+        f"P{percentile}_Delay" for percentile in PERCENTILES
+    ]
+    return pd.DataFrame(results, columns=columns)
+
+
+def describe_scenarios(distributions, scenarios, results):
+    """
+    Attach a readable description of each scenario's moves to its results
+    """
+    descriptions = []
+    for moves in scenarios:
+        if not moves:
+            descriptions.append("Baseline (no changes)")
+            continue
+        descriptions.append(
+            "; ".join(
+                f"{origin[0]}/{origin[1]}/{origin[2]} -> {target[0]}/{target[2]}"
+                for origin, target in moves.items()
+            )
+        )
+    described = results.copy()
+    described.insert(0, "Scenario", descriptions)
+    # Share of baseline volume affected by each scenario
+    cell_lookup = {cell: i for i, cell in enumerate(distributions["cells"])}
+    described.insert(
+        1,
+        "Moved_Volume_Share",
+        [
+            sum(distributions["volumes"][cell_lookup[origin]] for origin in moves)
+            for moves in scenarios
+        ],
+    )
+    return described
+
+
+def main(argv):
+    """
+    Sweep every single-cell reassignment and report the most helpful ones
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    data_path = os.path.join(
+        script_dir, "..", "2_data_preparation", "orders_and_shipments_final_cleaned.csv"
+    )
+    dataframe, _ = load_extracts(argv or [data_path])
+    dataframe = compute_delay_days(dataframe)
+
+    distributions = build_delay_distributions(dataframe)
+    scenarios = single_move_scenarios(distributions)
+    scenario_matrix = build_scenario_matrix(distributions, scenarios)
+    results = describe_scenarios(
+        distributions, scenarios, simulate_scenarios(distributions, scenario_matrix)
+    )
+
+    baseline = results.iloc[0]
+    results["On_Time_Change"] = results["On_Time_Rate"] - baseline["On_Time_Rate"]
+
+    print("\n" + "=" * 50)
+    print("WHAT-IF REASSIGNMENT SIMULATION")
+    print("=" * 50)
+    print(f" Scenarios evaluated: {len(scenarios):,}")
+    print(f" Baseline on-time rate: {baseline['On_Time_Rate'] * 100:.1f}%")
+    print(f" Baseline average delay: {baseline['Avg_Delay_Days']:.2f} days")
+    print("\n Most helpful single reassignments:")
+    print(results.iloc[1:].nlargest(10, "On_Time_Change").round(3).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))